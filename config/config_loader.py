@@ -1,21 +1,46 @@
+import copy  # Used to hand each caller its own copy of the cached config
+from functools import lru_cache  # Memoizes parsed configs keyed by path
+from pathlib import Path  # Resolves config paths independently of the working directory
+
 import yaml  # Importing the PyYAML library to read and parse YAML files
 
-def load_config(config_path: str = "config/config.yaml") -> dict:
+# Prefer the libyaml C parser when PyYAML was built with it, else fall back to pure Python
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# config.yaml sits next to this module, so the default works from any working directory
+DEFAULT_CONFIG_PATH = str(Path(__file__).resolve().parent / "config.yaml")
+
+
+@lru_cache(maxsize=8)
+def _parse_config(config_path: str) -> dict:
+    """
+    Parses a YAML config file once per path; later calls hit the cache.
+    """
+    # Open the YAML configuration file in read mode
+    with open(config_path, "r") as file:
+        config = yaml.load(file, Loader=_Loader)  # Safely parse the YAML content into a Python dictionary
+
+    return config
+
+
+def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> dict:
     """
     Loads the configuration settings from a YAML file and returns it as a Python dictionary.
+    The file is parsed only on the first call for a given path.
     
     Parameters:
-    config_path (str): Path to the YAML config file (default is 'config/config.yaml').
+    config_path (str): Path to the YAML config file (default is the config.yaml next to this module).
 
     Returns:
     dict: Configuration parameters as a dictionary.
     """
     
-    # Open the YAML configuration file in read mode
-    with open(config_path, "r") as file:
-        config = yaml.safe_load(file)  # Parse the YAML content into a Python dictionary
-
-    return config  # Return the parsed config dictionary for use throughout the project
+    # Deep copy so callers mutating their dict can't corrupt the cached one
+    # Resolve first so relative and absolute spellings of one file share a cache entry
+    return copy.deepcopy(_parse_config(str(Path(config_path).resolve())))
 
 
 '''
@@ -0,0 +1,9 @@
+from config.config_loader import load_config  # Cached YAML loader (parses config.yaml once per process)
+
+# Private copy of config.yaml; only the immutable values below are exported, so importers can't mutate shared state
+_config = load_config()
+
+# Frequently used values, pulled out once so callers don't repeat the key lookups
+COLLECTION_NAME = _config["astra_db"]["collection_name"]  # Astra DB collection for storing/retrieving vectors
+EMBEDDING_MODEL_NAME = _config["embedding_model"]["model_name"]  # Model used to convert text into embeddings
+TOP_K = _config["retriever"]["top_k"]  # Number of top similar results to return in a similarity search
@@ -1,8 +1,14 @@
 # Standard libraries
 import os
+import numpy as np
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from dotenv import load_dotenv
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 # LangChain core data structure for documents
 from langchain_core.documents import Document
@@ -13,9 +19,56 @@ from langchain_astradb import AstraDBVectorStore
 # Utility to load embedding models
 from utils.model_loader import ModelLoader
 
-# YAML-based configuration loader
+# Shared configuration loaded once from config.yaml
 from config.config_loader import load_config
 
+# Product CSV lives in the repo's data folder, resolved relative to this file (not the CWD)
+_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+_CSV_PATH = _DATA_DIR / 'flipkart_product_review.csv'
+
+# Only these CSV columns are used to build Documents
+CSV_COLUMNS = ['product_title', 'rating', 'summary', 'review']
+
+# Explicit dtypes let pandas skip type inference while parsing; text columns live in contiguous
+# Arrow buffers (pyarrow is a requirement) and float64 keeps ratings like 4.3 exact
+CSV_DTYPES = {'product_title': 'string[pyarrow]', 'rating': 'float64', 'summary': 'string[pyarrow]', 'review': 'string[pyarrow]'}
+
+# String columns hold missing cells as pd.NA, which isn't JSON serializable; hand them out as None
+def _text_values(series: pd.Series) -> list:
+    return series.astype(object).where(series.notna(), None).tolist()
+
+# Load .env file into environment once, at import
+load_dotenv()
+
+# AstraDB / Google credentials read from the environment
+@dataclass(frozen=True)
+class _AstraCreds:
+    google_api_key: str
+    db_api_endpoint: str
+    db_application_token: str
+    db_keyspace: str
+
+# Credentials are validated once per process and shared by every DataIngestion instance
+@lru_cache(maxsize=1)
+def _load_creds() -> _AstraCreds:
+    required_vars = ["GOOGLE_API_KEY", "ASTRA_DB_API_ENDPOINT", "ASTRA_DB_APPLICATION_TOKEN", "ASTRA_DB_KEYSPACE"]
+
+    # Check for missing env vars
+    values = {var: os.getenv(var) for var in required_vars}
+    missing_vars = [var for var, value in values.items() if value is None]
+    if missing_vars:
+        raise EnvironmentError(f"Missing environment variables: {missing_vars}")
+
+    return _AstraCreds(google_api_key=values["GOOGLE_API_KEY"],
+                       db_api_endpoint=values["ASTRA_DB_API_ENDPOINT"],
+                       db_application_token=values["ASTRA_DB_APPLICATION_TOKEN"],
+                       db_keyspace=values["ASTRA_DB_KEYSPACE"])
+
+# Embedding model is built once per process and shared by every DataIngestion instance
+@lru_cache(maxsize=1)
+def _get_embeddings():
+    return ModelLoader().load_embeddings()
+
 # DataIngestion Class Definition
 class DataIngestion:
     """
@@ -25,96 +78,112 @@ class DataIngestion:
     # __init__ Constructor
     def __init__(self):
     # """
-    # Initialize environment variables, embedding model, and set CSV file path.
+    # Initialize environment variables, config, and set CSV file path.
     # """
         print("Initializing DataIngestion pipeline...")
 
-        self.model_loader = ModelLoader()  # Load embedding model loader class
-        self._load_env_variables()         # Load .env credentials for API keys
+        self._creds = _load_creds()          # Validated .env credentials for API keys
         self.csv_path = self._get_csv_path()  # Resolve path to product CSV file
-        self.product_data = self._load_csv()  # Load the CSV as pandas DataFrame
-        self.config = load_config()          # Load config.yaml as a dict
+        self._validate_csv_columns()          # Check CSV header without loading rows
+        self.config = load_config()          # Own copy of config.yaml (parsed once per process, cached)
 
 
-    # Load Environment Variables
-    def _load_env_variables(self):
-    # '''
-    # Load and validate required environment variables.
-    # '''
-        
-        
-        load_dotenv()  # Load .env file into environment
+    # Resolve CSV File Path
+    def _get_csv_path(self):
+        """
+        Get path to the CSV file located inside 'data' folder.
+        """
+        # Raise error if CSV file not found
+        if not _CSV_PATH.is_file():
+            raise FileNotFoundError(f"CSV file not found at: {_CSV_PATH}")
 
-        required_vars = ["GOOGLE_API_KEY", "ASTRA_DB_API_ENDPOINT", "ASTRA_DB_APPLICATION_TOKEN", "ASTRA_DB_KEYSPACE"]
+        return str(_CSV_PATH)
 
-        # Check for missing env vars
-        missing_vars = [var for var in required_vars if os.getenv(var) is None]
-        if missing_vars:
-            raise EnvironmentError(f"Missing environment variables: {missing_vars}")
+    # Validate CSV Schema
+    def _validate_csv_columns(self):
+        """
+        Check the CSV header contains the required columns.
+        """
+        header = pd.read_csv(self.csv_path, nrows=0)  # Read only the header row
 
-        # Save valid credentials to object variables
-        self.google_api_key = os.getenv("GOOGLE_API_KEY")
-        self.db_api_endpoint = os.getenv("ASTRA_DB_API_ENDPOINT")
-        self.db_application_token = os.getenv("ASTRA_DB_APPLICATION_TOKEN")
-        self.db_keyspace = os.getenv("ASTRA_DB_KEYSPACE")
+        # Check if required columns exist (Index membership, no extra set built)
+        missing_columns = [col for col in CSV_COLUMNS if col not in header.columns]
+        if missing_columns:
+            raise ValueError(f"CSV must contain columns: {CSV_COLUMNS} (missing: {missing_columns})")
 
+    # Stream CSV with Product Data
+    def _iter_csv_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Yield product data from CSV in chunks so the whole file is never held in memory.
+        """
+        yield from pd.read_csv(self.csv_path, usecols=CSV_COLUMNS, dtype=CSV_DTYPES,
+                               engine='c', chunksize=chunksize)  # C parser with pre-declared dtypes
 
-       
-    # Resolve CSV File Path
-    def _get_csv_path(self):
+    # Convert a DataFrame → LangChain Documents
+    def _to_documents(self, df: pd.DataFrame) -> List[Document]:
         """
-        Get path to the CSV file located inside 'data' folder.
+        Convert a chunk of product data into LangChain Document objects.
+        """
+        # Pull each column out as a plain list (bulk conversion, no per-row pd.Series)
+        titles = _text_values(df['product_title'])
+        # Whole-number ratings go back to int so stored metadata stays e.g. 5, not 5.0
+        ratings = [int(r) if r.is_integer() else r for r in df['rating'].tolist()]
+        summaries = _text_values(df['summary'])
+        reviews = df['review'].tolist()
+
+        # Build a LangChain Document per review with product metadata
+        return [
+            Document(
+                page_content=review,
+                metadata={
+                    "product_name": title,
+                    "product_rating": rating,
+                    "product_summary": summary
+                }
+            )
+            for title, rating, summary, review in zip(titles, ratings, summaries, reviews)
+        ]
+
+    # Drop Duplicate Reviews
+    def _drop_seen_reviews(self, df: pd.DataFrame, seen_hashes: set) -> pd.DataFrame:
+        """
+        Drop reviews already seen in this chunk or earlier chunks, recording new ones in seen_hashes.
         """
-        current_dir = os.getcwd()  # Get current working directory
-        csv_path = os.path.join(current_dir, 'data', 'flipkart_product_review.csv')
+        # Hash review text so only 8-byte ints are kept across chunks, not the strings
+        hashes = pd.util.hash_pandas_object(df['review'], index=False)
+        hash_list = hashes.tolist()
 
-        # Raise error if CSV file not found
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"CSV file not found at: {csv_path}")
+        # Plain set lookups per hash; isin() would rebuild a table from the whole growing set every chunk
+        unseen = np.fromiter((h not in seen_hashes for h in hash_list), dtype=bool, count=len(hash_list))
+        keep = unseen & ~hashes.duplicated().to_numpy()
 
-        return csv_path
+        seen_hashes.update(hash_list)
+        return df[keep]
 
-    # Load CSV with Product Data
-    def _load_csv(self):
+    # Stream CSV Data → LangChain Documents
+    def iter_documents(self) -> Iterator[List[Document]]:
         """
-        Load product data from CSV.
+        Yield one list of LangChain Document objects per CSV chunk.
+        Identical reviews are embedded only once unless ingestion.deduplicate_reviews is false.
         """
-        df = pd.read_csv(self.csv_path)  # Read CSV into pandas DataFrame
-        expected_columns = {'product_title', 'rating', 'summary', 'review'}
-
-        # Check if required columns exist
-        if not expected_columns.issubset(set(df.columns)):
-            raise ValueError(f"CSV must contain columns: {expected_columns}")
+        ingestion_config = self.config.get("ingestion", {})
+        chunksize = ingestion_config.get("chunksize", 10_240)
+        deduplicate = ingestion_config.get("deduplicate_reviews", True)
+        seen_hashes = set()
 
-        return df
+        for chunk in self._iter_csv_chunks(chunksize):
+            if deduplicate:
+                chunk = self._drop_seen_reviews(chunk, seen_hashes)
+            yield self._to_documents(chunk)
 
     # Transform CSV Data → LangChain Documents
     def transform_data(self):
         """
-        Transform product data into list of LangChain Document objects.
-        """
-        product_list = []
-
-        # Convert each row into a dictionary
-        for _, row in self.product_data.iterrows():
-            product_entry = {
-                "product_name": row['product_title'],
-                "product_rating": row['rating'],
-                "product_summary": row['summary'],
-                "product_review": row['review']
-            }
-            product_list.append(product_entry)
-
-        # Convert each entry to a LangChain Document with metadata
-        documents = []
-        for entry in product_list:
-            metadata = {
-                "product_name": entry["product_name"],
-                "product_rating": entry["product_rating"],
-                "product_summary": entry["product_summary"]
-            }
-            doc = Document(page_content=entry["product_review"], metadata=metadata)
-            documents.append(doc)
+        Transform product data into a single list of LangChain Document objects.
+        Duplicate reviews are dropped (first occurrence kept) while ingestion.deduplicate_reviews
+        is on, so the list can be shorter than the number of CSV rows.
+        """
+        documents = [doc for batch in self.iter_documents() for doc in batch]
 
         print(f"Transformed {len(documents)} documents.")
         return documents
@@ -125,16 +194,53 @@ class DataIngestion:
         """
         Store documents into AstraDB vector store.
         """
+        return self.store_batches_in_vector_db([documents])  # A flat list is just a single batch
+
+    # Stream Embeddings into AstraDB
+    def store_batches_in_vector_db(self, batches: Iterable[List[Document]]):
+        """
+        Store batches of documents into AstraDB vector store as they arrive.
+        """
         collection_name=self.config["astra_db"]["collection_name"]  # Get collection name from config.yaml
 
         # Initialize AstraDB vector store with embedding model
-        vstore = AstraDBVectorStore(embedding= self.model_loader.load_embeddings(),
+        vstore = AstraDBVectorStore(embedding=_get_embeddings(),
                                     collection_name=collection_name,
-                                    api_endpoint=self.db_api_endpoint,
-                                    token=self.db_application_token,
-                                    namespace=self.db_keyspace)
+                                    api_endpoint=self._creds.db_api_endpoint,
+                                    token=self._creds.db_application_token,
+                                    namespace=self._creds.db_keyspace)
+
+        # Upload in fixed-size slices so each request stays small and failures are cheap to retry
+        ingestion_config = self.config.get("ingestion", {})
+        batch_size = ingestion_config.get("batch_size", 256)
+        parallelism = ingestion_config.get("parallelism", 4)
+
+        inserted_ids = []
+        pending = deque()  # In-flight uploads, oldest first, so ids come back in input order
+        leftover = []      # Tail of the previous batch, topped up by the next one so slices stay full
+
+        # Embedding + upload are remote I/O, so several slices can be in flight at once
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            for batch in batches:
+                documents = leftover + batch
+                full_end = len(documents) - len(documents) % batch_size
+
+                for i in range(0, full_end, batch_size):
+                    pending.append(executor.submit(vstore.add_documents, documents[i:i + batch_size]))  # Store each slice in AstraDB
+
+                    # Cap queued slices so a fast CSV reader can't pile the whole corpus into memory
+                    while len(pending) > 2 * parallelism:
+                        inserted_ids.extend(pending.popleft().result())
+
+                leftover = documents[full_end:]
+
+            # Flush the final partial slice
+            if leftover:
+                pending.append(executor.submit(vstore.add_documents, leftover))
+
+            while pending:
+                inserted_ids.extend(pending.popleft().result())
 
-        inserted_ids = vstore.add_documents(documents)  # Store documents in AstraDB
         print(f"Successfully inserted {len(inserted_ids)} documents into AstraDB.")
         return vstore, inserted_ids
 
@@ -144,16 +250,19 @@ class DataIngestion:
         """
         Run the full data ingestion pipeline: transform data and store into vector DB.
         """
-        documents = self.transform_data()  # Step 1: CSV → LangChain Documents
-        vstore, inserted_ids = self.store_in_vector_db(documents)  # Step 2: Store in vector DB
+        batches = self.iter_documents()  # Step 1: CSV chunks → LangChain Documents (lazy)
+        vstore, inserted_ids = self.store_batches_in_vector_db(batches)  # Step 2: Store in vector DB as chunks stream in
 
-        # Optional: Run a quick similarity search
-        query = "Can you tell me the low budget headphone?"
-        results = vstore.similarity_search(query)
+        # Optional: Run a quick similarity search (enable via ingestion.run_sample_query in config.yaml)
+        if self.config.get("ingestion", {}).get("run_sample_query", False):
+            query = "Can you tell me the low budget headphone?"
+            results = vstore.similarity_search(query)
 
-        print(f"\nSample search results for query: '{query}'")
-        for res in results:
-            print(f"Content: {res.page_content}\nMetadata: {res.metadata}\n")
+            print(f"\nSample search results for query: '{query}'")
+            for res in results:
+                print(f"Content: {res.page_content}\nMetadata: {res.metadata}\n")
+
+        return vstore, inserted_ids
 
 # CLI Entry Point
 # Run if this file is executed directly
@@ -168,7 +277,7 @@ Part	Purpose
 ✅ Class-based design-->	Makes it modular, testable, and reusable
 ✅ .env loading-->	Keeps secrets out of codebase
 ✅ config.yaml--> usage	Externalizes parameters (cleaner + scalable)
-✅ CSV ingestion-->	Reads structured Flipkart product reviews
+✅ CSV ingestion-->	Streams structured Flipkart product reviews in chunks
 ✅ LangChain Document-->	Standard format for text + metadata
 ✅ AstraDB Vector Store-->	Stores embeddings for search/retrieval
 ✅ run_pipeline()-->	Automates everything end-to-end
@@ -1,13 +1,10 @@
-# Import the config loader function from the config directory
-from config.config_loader import load_config
+# Import the shared settings; config.yaml is parsed once when this module is first imported
+from config.settings import COLLECTION_NAME, EMBEDDING_MODEL_NAME, TOP_K
 
-# Load the entire configuration from the YAML file as a Python dictionary
-config = load_config()
-
-# Access specific configuration values using dictionary keys
-collection_name = config["astra_db"]["collection_name"]  # Name of the Astra DB collection for storing/retrieving vectors
-embedding_model_name = config["embedding_model"]["model_name"]  # The model used to convert text into embeddings
-top_k = config["retriever"]["top_k"]  # Number of top similar results to return in a similarity search
+# Access specific configuration values loaded from config.yaml
+collection_name = COLLECTION_NAME  # Name of the Astra DB collection for storing/retrieving vectors
+embedding_model_name = EMBEDDING_MODEL_NAME  # The model used to convert text into embeddings
+top_k = TOP_K  # Number of top similar results to return in a similarity search
 
 # Print out the loaded values to verify they are being loaded correctly
 print(collection_name)
@@ -1,6 +1,4 @@
-import yaml
+# Single shared loader (and cache) lives in config.config_loader; re-exported here for existing imports
+from config.config_loader import load_config
 
-def load_config(config_path: str = "config/config.yaml") -> dict:
-    with open(config_path, "r") as file:
-        config = yaml.safe_load(file)
-    return config
\ No newline at end of file
+__all__ = ["load_config"]